@@ -0,0 +1,26 @@
+"""Build the optional compiled extensions in place:
+
+    python setup.py build_ext --inplace
+
+Everything also runs without them; src/tuples.py falls back to its
+pure-Python classes when src.ctuple is not built.
+"""
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name="ray_tracer",
+    ext_modules=cythonize(
+        [
+            Extension("src.ctuple", ["src/ctuple.pyx"], include_dirs=["src"]),
+            Extension("src._batch", ["src/_batch.pyx", "src/batch_kernels.c"],
+                      include_dirs=["src"]),
+        ],
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "wraparound": False,
+            "cdivision": True,
+        },
+    ),
+)
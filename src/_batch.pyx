@@ -0,0 +1,93 @@
+# cython: language_level=3
+"""Compiled float32 column kernels for src/tuples_batch.py.
+
+The C implementation (see batch_kernels.c) is chosen once at import:
+AVX2+FMA when the CPU supports it, plain loops otherwise. All columns
+must be C-contiguous float32 arrays of the same length.
+"""
+import numpy as np
+
+cdef extern from "batch_kernels.h" nogil:
+    int batch_init()
+    int batch_has_avx2()
+    void batch_add(const float *a, const float *b, float *r, size_t n)
+    void batch_sub(const float *a, const float *b, float *r, size_t n)
+    void batch_dot3(const float *ax, const float *ay, const float *az,
+                    const float *bx, const float *by, const float *bz,
+                    float *r, size_t n)
+    void batch_cross3(const float *ax, const float *ay, const float *az,
+                      const float *bx, const float *by, const float *bz,
+                      float *rx, float *ry, float *rz, size_t n)
+    void batch_mag3(const float *x, const float *y, const float *z,
+                    float *r, size_t n)
+
+batch_init()
+
+
+def cpu_has_avx2():
+    """Return True if the AVX2 kernels were selected at import."""
+    return bool(batch_has_avx2())
+
+
+cdef Py_ssize_t _length(const float[::1] first, tuple rest) except -1:
+    """Return the shared column length, or raise if the lengths differ."""
+    cdef Py_ssize_t n = first.shape[0]
+    for col in rest:
+        if len(col) != n:
+            raise ValueError("All columns must have the same length.")
+    return n
+
+
+def add(const float[::1] a, const float[::1] b):
+    """Return a + b for two float32 columns."""
+    cdef Py_ssize_t n = _length(a, (b,))
+    cdef float[::1] r = np.empty(n, dtype=np.float32)
+    if n:
+        with nogil:
+            batch_add(&a[0], &b[0], &r[0], n)
+    return r.base
+
+
+def sub(const float[::1] a, const float[::1] b):
+    """Return a - b for two float32 columns."""
+    cdef Py_ssize_t n = _length(a, (b,))
+    cdef float[::1] r = np.empty(n, dtype=np.float32)
+    if n:
+        with nogil:
+            batch_sub(&a[0], &b[0], &r[0], n)
+    return r.base
+
+
+def dot3(const float[::1] ax, const float[::1] ay, const float[::1] az,
+         const float[::1] bx, const float[::1] by, const float[::1] bz):
+    """Return the per-element dot product of two sets of xyz columns."""
+    cdef Py_ssize_t n = _length(ax, (ay, az, bx, by, bz))
+    cdef float[::1] r = np.empty(n, dtype=np.float32)
+    if n:
+        with nogil:
+            batch_dot3(&ax[0], &ay[0], &az[0], &bx[0], &by[0], &bz[0], &r[0], n)
+    return r.base
+
+
+def cross3(const float[::1] ax, const float[::1] ay, const float[::1] az,
+           const float[::1] bx, const float[::1] by, const float[::1] bz):
+    """Return the per-element cross product of two sets of xyz columns."""
+    cdef Py_ssize_t n = _length(ax, (ay, az, bx, by, bz))
+    cdef float[::1] rx = np.empty(n, dtype=np.float32)
+    cdef float[::1] ry = np.empty(n, dtype=np.float32)
+    cdef float[::1] rz = np.empty(n, dtype=np.float32)
+    if n:
+        with nogil:
+            batch_cross3(&ax[0], &ay[0], &az[0], &bx[0], &by[0], &bz[0],
+                         &rx[0], &ry[0], &rz[0], n)
+    return rx.base, ry.base, rz.base
+
+
+def mag3(const float[::1] x, const float[::1] y, const float[::1] z):
+    """Return the per-element magnitude of a set of xyz columns."""
+    cdef Py_ssize_t n = _length(x, (y, z))
+    cdef float[::1] r = np.empty(n, dtype=np.float32)
+    if n:
+        with nogil:
+            batch_mag3(&x[0], &y[0], &z[0], &r[0], n)
+    return r.base
@@ -0,0 +1,155 @@
+#include "batch_kernels.h"
+#include <math.h>
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#define HAVE_AVX2_PATH 1
+#include <immintrin.h>
+#endif
+
+/* --- scalar implementations --- */
+
+static void add_scalar(const float *a, const float *b, float *r, size_t n) {
+    for (size_t i = 0; i < n; i++) r[i] = a[i] + b[i];
+}
+
+static void sub_scalar(const float *a, const float *b, float *r, size_t n) {
+    for (size_t i = 0; i < n; i++) r[i] = a[i] - b[i];
+}
+
+static void dot3_scalar(const float *ax, const float *ay, const float *az,
+                        const float *bx, const float *by, const float *bz,
+                        float *r, size_t n) {
+    for (size_t i = 0; i < n; i++)
+        r[i] = ax[i] * bx[i] + ay[i] * by[i] + az[i] * bz[i];
+}
+
+static void cross3_scalar(const float *ax, const float *ay, const float *az,
+                          const float *bx, const float *by, const float *bz,
+                          float *rx, float *ry, float *rz, size_t n) {
+    for (size_t i = 0; i < n; i++) {
+        rx[i] = ay[i] * bz[i] - az[i] * by[i];
+        ry[i] = az[i] * bx[i] - ax[i] * bz[i];
+        rz[i] = ax[i] * by[i] - ay[i] * bx[i];
+    }
+}
+
+static void mag3_scalar(const float *x, const float *y, const float *z,
+                        float *r, size_t n) {
+    for (size_t i = 0; i < n; i++)
+        r[i] = sqrtf(x[i] * x[i] + y[i] * y[i] + z[i] * z[i]);
+}
+
+/* --- AVX2 implementations: 8 floats per iteration, scalar tail --- */
+
+#ifdef HAVE_AVX2_PATH
+#define AVX2 __attribute__((target("avx2,fma")))
+
+AVX2 static void add_avx2(const float *a, const float *b, float *r, size_t n) {
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8)
+        _mm256_storeu_ps(r + i, _mm256_add_ps(_mm256_loadu_ps(a + i), _mm256_loadu_ps(b + i)));
+    add_scalar(a + i, b + i, r + i, n - i);
+}
+
+AVX2 static void sub_avx2(const float *a, const float *b, float *r, size_t n) {
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8)
+        _mm256_storeu_ps(r + i, _mm256_sub_ps(_mm256_loadu_ps(a + i), _mm256_loadu_ps(b + i)));
+    sub_scalar(a + i, b + i, r + i, n - i);
+}
+
+AVX2 static void dot3_avx2(const float *ax, const float *ay, const float *az,
+                           const float *bx, const float *by, const float *bz,
+                           float *r, size_t n) {
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        __m256 acc = _mm256_mul_ps(_mm256_loadu_ps(ax + i), _mm256_loadu_ps(bx + i));
+        acc = _mm256_fmadd_ps(_mm256_loadu_ps(ay + i), _mm256_loadu_ps(by + i), acc);
+        acc = _mm256_fmadd_ps(_mm256_loadu_ps(az + i), _mm256_loadu_ps(bz + i), acc);
+        _mm256_storeu_ps(r + i, acc);
+    }
+    dot3_scalar(ax + i, ay + i, az + i, bx + i, by + i, bz + i, r + i, n - i);
+}
+
+AVX2 static void cross3_avx2(const float *ax, const float *ay, const float *az,
+                             const float *bx, const float *by, const float *bz,
+                             float *rx, float *ry, float *rz, size_t n) {
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        __m256 vax = _mm256_loadu_ps(ax + i), vay = _mm256_loadu_ps(ay + i), vaz = _mm256_loadu_ps(az + i);
+        __m256 vbx = _mm256_loadu_ps(bx + i), vby = _mm256_loadu_ps(by + i), vbz = _mm256_loadu_ps(bz + i);
+        _mm256_storeu_ps(rx + i, _mm256_fmsub_ps(vay, vbz, _mm256_mul_ps(vaz, vby)));
+        _mm256_storeu_ps(ry + i, _mm256_fmsub_ps(vaz, vbx, _mm256_mul_ps(vax, vbz)));
+        _mm256_storeu_ps(rz + i, _mm256_fmsub_ps(vax, vby, _mm256_mul_ps(vay, vbx)));
+    }
+    cross3_scalar(ax + i, ay + i, az + i, bx + i, by + i, bz + i,
+                  rx + i, ry + i, rz + i, n - i);
+}
+
+AVX2 static void mag3_avx2(const float *x, const float *y, const float *z,
+                           float *r, size_t n) {
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        __m256 vx = _mm256_loadu_ps(x + i), vy = _mm256_loadu_ps(y + i), vz = _mm256_loadu_ps(z + i);
+        __m256 acc = _mm256_fmadd_ps(vz, vz, _mm256_fmadd_ps(vy, vy, _mm256_mul_ps(vx, vx)));
+        _mm256_storeu_ps(r + i, _mm256_sqrt_ps(acc));
+    }
+    mag3_scalar(x + i, y + i, z + i, r + i, n - i);
+}
+#endif
+
+/* --- dispatch --- */
+
+static void (*add_impl)(const float *, const float *, float *, size_t) = add_scalar;
+static void (*sub_impl)(const float *, const float *, float *, size_t) = sub_scalar;
+static void (*dot3_impl)(const float *, const float *, const float *,
+                         const float *, const float *, const float *,
+                         float *, size_t) = dot3_scalar;
+static void (*cross3_impl)(const float *, const float *, const float *,
+                           const float *, const float *, const float *,
+                           float *, float *, float *, size_t) = cross3_scalar;
+static void (*mag3_impl)(const float *, const float *, const float *,
+                         float *, size_t) = mag3_scalar;
+static int has_avx2 = 0;
+
+int batch_init(void) {
+#ifdef HAVE_AVX2_PATH
+    __builtin_cpu_init();
+    if (__builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma")) {
+        add_impl = add_avx2;
+        sub_impl = sub_avx2;
+        dot3_impl = dot3_avx2;
+        cross3_impl = cross3_avx2;
+        mag3_impl = mag3_avx2;
+        has_avx2 = 1;
+    }
+#endif
+    return has_avx2;
+}
+
+int batch_has_avx2(void) { return has_avx2; }
+
+void batch_add(const float *a, const float *b, float *r, size_t n) {
+    add_impl(a, b, r, n);
+}
+
+void batch_sub(const float *a, const float *b, float *r, size_t n) {
+    sub_impl(a, b, r, n);
+}
+
+void batch_dot3(const float *ax, const float *ay, const float *az,
+                const float *bx, const float *by, const float *bz,
+                float *r, size_t n) {
+    dot3_impl(ax, ay, az, bx, by, bz, r, n);
+}
+
+void batch_cross3(const float *ax, const float *ay, const float *az,
+                  const float *bx, const float *by, const float *bz,
+                  float *rx, float *ry, float *rz, size_t n) {
+    cross3_impl(ax, ay, az, bx, by, bz, rx, ry, rz, n);
+}
+
+void batch_mag3(const float *x, const float *y, const float *z,
+                float *r, size_t n) {
+    mag3_impl(x, y, z, r, n);
+}
@@ -0,0 +1,26 @@
+/* float32 column kernels behind src/_batch.pyx.
+ *
+ * Every function works on contiguous float columns of length n. The
+ * implementation (AVX2+FMA or plain scalar loops) is picked once by
+ * batch_init() from what the running CPU supports.
+ */
+#ifndef BATCH_KERNELS_H
+#define BATCH_KERNELS_H
+
+#include <stddef.h>
+
+int batch_init(void);
+int batch_has_avx2(void);
+
+void batch_add(const float *a, const float *b, float *r, size_t n);
+void batch_sub(const float *a, const float *b, float *r, size_t n);
+void batch_dot3(const float *ax, const float *ay, const float *az,
+                const float *bx, const float *by, const float *bz,
+                float *r, size_t n);
+void batch_cross3(const float *ax, const float *ay, const float *az,
+                  const float *bx, const float *by, const float *bz,
+                  float *rx, float *ry, float *rz, size_t n);
+void batch_mag3(const float *x, const float *y, const float *z,
+                float *r, size_t n);
+
+#endif /* BATCH_KERNELS_H */
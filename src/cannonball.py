@@ -1,30 +1,73 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from .tuples import Tuple, point, vector
+import numpy as np
+import sys
 
 @dataclass
 class Projectile:
     position: Tuple
     velocity: Tuple
 
-@dataclass
+@dataclass(frozen=True)
 class Environment:
     gravity: Tuple
     wind: Tuple
+    accel: Tuple = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # the environment is frozen, so gravity + wind can be computed
+        # once here instead of on every step without ever going stale
+        object.__setattr__(self, "accel", self.gravity + self.wind)
 
 def step(env: Environment, proj: Projectile) -> Projectile:
     """Advance the projectile by one time step."""
-    new_position = proj.position + proj.velocity
-    new_velocity = proj.velocity + env.gravity + env.wind
-    return Projectile(new_position, new_velocity)
+    pos = proj.position
+    vel = proj.velocity
+    return Projectile(pos + vel, vel + env.accel)
+
+def simulate_batch(positions: np.ndarray, velocities: np.ndarray,
+                   accel: np.ndarray, max_steps: int) -> np.ndarray:
+    """Fly a swarm of N projectiles until each one reaches the ground.
+
+    positions and velocities are (N, 3) arrays that are updated in
+    place; accel is the shared (3,) acceleration (gravity + wind).
+    Each step is one vectorized add over the whole swarm, so prefer
+    float32 arrays for large N to halve the memory traffic.
+
+    Returns an (N,) array with the number of steps each projectile took
+    to reach y <= 0, matching the scalar `step` loop. Projectiles that
+    are still airborne after max_steps report -1.
+    Landed projectiles stop moving.
+    """
+    steps_taken = np.full(len(positions), -1, dtype=np.int64)
+    alive = positions[:, 1] > 0
+    steps_taken[~alive] = 0
+    for t in range(1, max_steps + 1):
+        if not alive.any():
+            break
+        moving = alive[:, None]
+        np.add(positions, velocities, out=positions, where=moving)
+        np.add(velocities, accel, out=velocities, where=moving)
+        still_alive = positions[:, 1] > 0
+        steps_taken[alive & ~still_alive] = t
+        alive = still_alive
+    return steps_taken
+
+if __name__ == "__main__":
+    p = Projectile(position=point(0, 1, 0), velocity=vector(1, 1, 0))
+    env = Environment(gravity=vector(0, -0.1, 0), wind=vector(-0.01, 0, 0))
 
-p = Projectile(position=point(0, 1, 0), velocity=vector(1, 1, 0))
-env = Environment(gravity=vector(0, -0.1, 0), wind=vector(-0.01, 0, 0))
+    # the loop works on locals and collects its report lines, writing
+    # them out once at the end instead of printing every step
+    accel = env.accel
+    pos, vel = p.position, p.velocity
+    steps = 0
+    out = [f"Step {steps}: position={pos}, velocity={vel}\n"]
 
-steps = 0
-print(f"Step {steps}: position={p.position}, velocity={p.velocity}")
+    while pos.y > 0:
+        pos, vel = pos + vel, vel + accel
+        steps += 1
+        out.append(f"Step {steps}: position={pos}, velocity={vel}\n")
 
-while p.position.y > 0:
-    p = step(env, p)
-    steps += 1
-    print(f"Step {steps}: position={p.position}, velocity={p.velocity}")
+    sys.stdout.write("".join(out))
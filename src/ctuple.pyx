@@ -0,0 +1,287 @@
+# cython: language_level=3
+"""Compiled Tuple and Color with C double components.
+
+A drop-in replacement for the pure-Python classes in src/tuples.py,
+which imports them from here whenever the extension has been built:
+
+    python setup.py build_ext --inplace
+"""
+import math
+import numpy as np
+from libc.math cimport fabs
+from libc.stdint cimport uint64_t
+from libc.string cimport memcpy
+from src.utils.math_utils import EPSILON
+
+cdef extern from "ctuple_simd.h" nogil:
+    void add4(double *r, const double *a, const double *b)
+    void sub4(double *r, const double *a, const double *b)
+    void mul4(double *r, const double *a, const double *b)
+    void scale4(double *r, const double *a, double s)
+    void div4(double *r, const double *a, double s)
+    void neg4(double *r, const double *a)
+    double dot4(const double *a, const double *b)
+
+cdef double _EPSILON = EPSILON
+cdef object _hypot = math.hypot
+cdef uint64_t _HASH_MULT = 0x9E3779B97F4A7C15  # 2**64 / golden ratio
+cdef uint64_t _MIX_MULT = 0xFF51AFD7ED558CCD   # from murmur3's 64-bit finalizer
+
+
+cdef inline uint64_t _bits(double d) noexcept nogil:
+    """Return the IEEE-754 bit pattern of d, with -0.0 folded into 0.0."""
+    cdef uint64_t b
+    d += 0.0
+    memcpy(&b, &d, sizeof(double))
+    return b
+
+
+cdef inline Tuple _alloc(type cls):
+    """Allocate an uninitialized tuple of type cls, skipping __init__."""
+    cdef Tuple t = cls.__new__(cls)
+    t._mag = -1.0
+    return t
+
+cdef inline Tuple _new(type cls, double x, double y, double z, double w):
+    """Allocate a tuple of type cls holding (x, y, z, w)."""
+    cdef Tuple t = _alloc(cls)
+    t.v[0] = x
+    t.v[1] = y
+    t.v[2] = z
+    t.v[3] = w
+    return t
+
+
+cdef class Tuple:
+    """A 4D tuple used to represent points, vectors, and colors in 3D space.
+
+    See src/tuples.py for the full description; this class mirrors it
+    with the components in a C double[4], so arithmetic runs as packed
+    SSE2 instructions (see ctuple_simd.h). The magnitude is cached in
+    _mag, which is -1.0 until first computed.
+    """
+    cdef double v[4]
+    cdef readonly double _mag
+
+    def __init__(self, double x, double y, double z, double w):
+        self.v[0] = x
+        self.v[1] = y
+        self.v[2] = z
+        self.v[3] = w
+        self._mag = -1.0
+
+    @property
+    def x(self): return self.v[0]
+
+    @property
+    def y(self): return self.v[1]
+
+    @property
+    def z(self): return self.v[2]
+
+    @property
+    def w(self): return self.v[3]
+
+    @classmethod
+    def _raw(cls, double x, double y, double z, double w):
+        """Build a tuple without going through __init__ (internal fast path)."""
+        return _new(cls, x, y, z, w)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(x={self.v[0]!r}, y={self.v[1]!r}, z={self.v[2]!r}, w={self.v[3]!r})"
+
+    def __hash__(self):
+        # fold the four bit patterns directly instead of hashing a
+        # freshly built Python tuple
+        cdef uint64_t h = 0
+        cdef int i
+        for i in range(4):
+            h = (h ^ _bits(self.v[i])) * _HASH_MULT
+            h ^= h >> 32
+        h *= _MIX_MULT  # murmur3-style finish spreads bits into the low end
+        h ^= h >> 33
+        cdef Py_hash_t r = <Py_hash_t>h
+        return -2 if r == -1 else r
+
+    # --- properties ---
+
+    @property
+    def is_point(self):
+        """Return True if this tuple represents a point (w = 1.0)."""
+        return self.v[3] == 1.0
+
+    @property
+    def is_vector(self):
+        """Return True if this tuple represents a vector (w = 0.0)."""
+        return self.v[3] == 0.0
+
+    @property
+    def is_unit_vector(self):
+        """Return True if this tuple is a vector with a magnitude of 1."""
+        return self.v[3] == 0.0 and fabs(self.magnitude() - 1.0) < _EPSILON
+
+    @property
+    def is_color(self):
+        """Return True if this tuple was created as a color (see Color)."""
+        return isinstance(self, Color)
+
+    # --- color channel aliases ---
+
+    @property
+    def red(self): return self.v[0]
+
+    @property
+    def green(self): return self.v[1]
+
+    @property
+    def blue(self): return self.v[2]
+
+    # --- factories ---
+
+    @staticmethod
+    def point(double x, double y, double z):
+        """Create a point at (x, y, z) in 3D space."""
+        return _new(Tuple, x, y, z, 1.0)
+
+    @staticmethod
+    def vector(double x, double y, double z):
+        """Create a vector with components (x, y, z)."""
+        return _new(Tuple, x, y, z, 0.0)
+
+    @staticmethod
+    def color(double red, double green, double blue):
+        """Create a color using normalized floats (0-1)."""
+        return _new(Color, red, green, blue, 0.0)
+
+    @staticmethod
+    def from_array(a):
+        """Create a tuple from a length-4 array-like of (x, y, z, w)."""
+        x, y, z, w = np.asarray(a, dtype=np.float64).tolist()
+        return _new(Tuple, x, y, z, w)
+
+    # --- conversions ---
+
+    def to_array(self, dtype=np.float64):
+        """Return the components as a shape (4,) ndarray of (x, y, z, w)."""
+        return np.array((self.v[0], self.v[1], self.v[2], self.v[3]), dtype=dtype)
+
+    # --- arithmetic ---
+
+    def __add__(self, other):
+        """Add two tuples component-wise."""
+        if not isinstance(other, Tuple):
+            return NotImplemented
+        cdef Tuple r = _alloc(type(self))
+        add4(r.v, self.v, (<Tuple>other).v)
+        return r
+
+    def __sub__(self, other):
+        """Subtract two tuples component-wise."""
+        if not isinstance(other, Tuple):
+            return NotImplemented
+        cdef Tuple r = _alloc(type(self))
+        sub4(r.v, self.v, (<Tuple>other).v)
+        return r
+
+    def __eq__(self, other):
+        """Compare tuples with EPSILON tolerance."""
+        if not isinstance(other, Tuple):
+            return NotImplemented
+        cdef Tuple o = <Tuple>other
+        return (fabs(self.v[0] - o.v[0]) < _EPSILON
+                and fabs(self.v[1] - o.v[1]) < _EPSILON
+                and fabs(self.v[2] - o.v[2]) < _EPSILON
+                and fabs(self.v[3] - o.v[3]) < _EPSILON)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __neg__(self):
+        """Return a new Tuple with all components negated."""
+        cdef Tuple r = _alloc(type(self))
+        neg4(r.v, self.v)
+        return r
+
+    def __mul__(self, scalar):
+        """Multiply all components of the tuple by a scalar."""
+        cdef double s
+        try:
+            s = scalar
+        except TypeError:
+            return NotImplemented
+        cdef Tuple r = _alloc(type(self))
+        scale4(r.v, self.v, s)
+        return r
+
+    def __truediv__(self, scalar):
+        """Divide all components of the tuple by a scalar."""
+        cdef double s
+        try:
+            s = scalar
+        except TypeError:
+            return NotImplemented
+        if s == 0.0:
+            raise ZeroDivisionError("float division by zero")
+        cdef Tuple r = _alloc(type(self))
+        div4(r.v, self.v, s)
+        return r
+
+    # --- color operations ---
+
+    def hadamard(self, Tuple other not None):
+        """Multiply two colors component-wise (Hadamard product)."""
+        cdef Tuple r = _alloc(type(self))
+        mul4(r.v, self.v, other.v)
+        r.v[3] = 0.0  # colors always have w=0.0
+        return r
+
+    # --- vector operations ---
+
+    cpdef double magnitude(self):
+        """Return the magnitude (length) of the vector; cached.
+
+        Goes through math.hypot, like the pure-Python class, so huge
+        components do not overflow and both builds agree to the last bit.
+        """
+        if self._mag < 0.0:
+            self._mag = _hypot(self.v[0], self.v[1], self.v[2], self.v[3])
+        return self._mag
+
+    def normalize(self):
+        """Return a unit vector in the same direction as this vector."""
+        if self.v[3] != 0.0:
+            raise ValueError("Normalize is only defined for vectors.")
+        cdef double mag = self.magnitude()
+        if fabs(mag) < _EPSILON:
+            raise ValueError("A zero vector cannot be normalized.")
+        cdef Tuple unit = _alloc(Tuple)
+        div4(unit.v, self.v, mag)
+        unit._mag = 1.0
+        return unit
+
+    cpdef double dot(self, Tuple other) except? -1.0:
+        """Return the dot product of two tuples."""
+        if other is None:
+            raise TypeError("Dot product requires a Tuple.")
+        if self.v[3] != 0.0:
+            raise ValueError("Dot product cannot be performed on points.")
+        return dot4(self.v, other.v)
+
+    def cross(self, Tuple other not None):
+        """Return the cross product of two vectors."""
+        if __debug__:  # stripped under python -O, as in src/tuples.py
+            if self.v[3] != 0.0 or other.v[3] != 0.0:
+                raise ValueError("Cross product is only defined for vectors.")
+        cdef double *a = self.v
+        cdef double *b = other.v
+        return _new(Tuple,
+                    a[1] * b[2] - a[2] * b[1],
+                    a[2] * b[0] - a[0] * b[2],
+                    a[0] * b[1] - a[1] * b[0],
+                    0.0)
+
+
+cdef class Color(Tuple):
+    """A Tuple tagged as a color; arithmetic on a color returns a color."""
+    pass
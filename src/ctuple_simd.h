@@ -0,0 +1,85 @@
+/* SIMD helpers for the 4-component tuples in ctuple.pyx.
+ *
+ * A tuple is a double[4] (x, y, z, w). With SSE2 the four lanes live in
+ * two __m128d registers (xy and zw), so every component-wise operation
+ * is two packed instructions. Tuples stay double precision to match the
+ * pure-Python Tuple exactly. Other targets use the plain scalar loops.
+ */
+#ifndef CTUPLE_SIMD_H
+#define CTUPLE_SIMD_H
+
+#if defined(__SSE2__) || defined(_M_X64)
+#include <emmintrin.h>
+
+static inline void add4(double *r, const double *a, const double *b) {
+    _mm_storeu_pd(r, _mm_add_pd(_mm_loadu_pd(a), _mm_loadu_pd(b)));
+    _mm_storeu_pd(r + 2, _mm_add_pd(_mm_loadu_pd(a + 2), _mm_loadu_pd(b + 2)));
+}
+
+static inline void sub4(double *r, const double *a, const double *b) {
+    _mm_storeu_pd(r, _mm_sub_pd(_mm_loadu_pd(a), _mm_loadu_pd(b)));
+    _mm_storeu_pd(r + 2, _mm_sub_pd(_mm_loadu_pd(a + 2), _mm_loadu_pd(b + 2)));
+}
+
+static inline void mul4(double *r, const double *a, const double *b) {
+    _mm_storeu_pd(r, _mm_mul_pd(_mm_loadu_pd(a), _mm_loadu_pd(b)));
+    _mm_storeu_pd(r + 2, _mm_mul_pd(_mm_loadu_pd(a + 2), _mm_loadu_pd(b + 2)));
+}
+
+static inline void scale4(double *r, const double *a, double s) {
+    __m128d vs = _mm_set1_pd(s);
+    _mm_storeu_pd(r, _mm_mul_pd(_mm_loadu_pd(a), vs));
+    _mm_storeu_pd(r + 2, _mm_mul_pd(_mm_loadu_pd(a + 2), vs));
+}
+
+static inline void div4(double *r, const double *a, double s) {
+    __m128d vs = _mm_set1_pd(s);
+    _mm_storeu_pd(r, _mm_div_pd(_mm_loadu_pd(a), vs));
+    _mm_storeu_pd(r + 2, _mm_div_pd(_mm_loadu_pd(a + 2), vs));
+}
+
+static inline void neg4(double *r, const double *a) {
+    __m128d sign = _mm_set1_pd(-0.0);
+    _mm_storeu_pd(r, _mm_xor_pd(_mm_loadu_pd(a), sign));
+    _mm_storeu_pd(r + 2, _mm_xor_pd(_mm_loadu_pd(a + 2), sign));
+}
+
+static inline double dot4(const double *a, const double *b) {
+    __m128d s = _mm_add_pd(_mm_mul_pd(_mm_loadu_pd(a), _mm_loadu_pd(b)),
+                           _mm_mul_pd(_mm_loadu_pd(a + 2), _mm_loadu_pd(b + 2)));
+    return _mm_cvtsd_f64(_mm_add_sd(s, _mm_unpackhi_pd(s, s)));
+}
+
+#else
+
+static inline void add4(double *r, const double *a, const double *b) {
+    for (int i = 0; i < 4; i++) r[i] = a[i] + b[i];
+}
+
+static inline void sub4(double *r, const double *a, const double *b) {
+    for (int i = 0; i < 4; i++) r[i] = a[i] - b[i];
+}
+
+static inline void mul4(double *r, const double *a, const double *b) {
+    for (int i = 0; i < 4; i++) r[i] = a[i] * b[i];
+}
+
+static inline void scale4(double *r, const double *a, double s) {
+    for (int i = 0; i < 4; i++) r[i] = a[i] * s;
+}
+
+static inline void div4(double *r, const double *a, double s) {
+    for (int i = 0; i < 4; i++) r[i] = a[i] / s;
+}
+
+static inline void neg4(double *r, const double *a) {
+    for (int i = 0; i < 4; i++) r[i] = -a[i];
+}
+
+static inline double dot4(const double *a, const double *b) {
+    return (a[0] * b[0] + a[2] * b[2]) + (a[1] * b[1] + a[3] * b[3]);
+}
+
+#endif
+
+#endif /* CTUPLE_SIMD_H */
@@ -1,33 +1,68 @@
 from __future__ import annotations
-from src.utils.math_utils import equal
-from dataclasses import dataclass
+from src.utils.math_utils import EPSILON, equal
 import math
+import numpy as np
 
 
-@dataclass(frozen=True)
 class Tuple:
     """A 4D tuple used to represent points, vectors, and colors in 3D space.
 
     The w component determines whether the tuple is a point (w=1.0)
     or a vector (w=0.0). Other values of w generally do not
     correspond to meaningful geometry.
+
+    Tuples are immutable: operations always return a new tuple, and
+    assigning to a component raises AttributeError. Components live in
+    __slots__ rather than a frozen dataclass; they are written once,
+    through the slot descriptors, when the tuple is built. The
+    magnitude is computed lazily and cached in _mag.
     """
-    x: float
-    y: float
-    z: float
-    w: float
+    __slots__ = ("x", "y", "z", "w", "_mag")
+
+    def __init__(self, x: float, y: float, z: float, w: float):
+        _set_x(self, x)
+        _set_y(self, y)
+        _set_z(self, z)
+        _set_w(self, w)
+        _set_mag(self, None)
+
+    @classmethod
+    def _raw(cls, x: float, y: float, z: float, w: float) -> "Tuple":
+        """Build a tuple without going through __init__ (internal fast path)."""
+        inst = object.__new__(cls)
+        _set_x(inst, x)
+        _set_y(inst, y)
+        _set_z(inst, z)
+        _set_w(inst, w)
+        _set_mag(inst, None)
+        return inst
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable; cannot delete {name!r}")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(x={self.x!r}, y={self.y!r}, z={self.z!r}, w={self.w!r})"
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.z, self.w))
 
     # --- properties ---
 
     @property
     def is_point(self) -> bool:
-        """Return True if this tuple represents a point (w ≈ 1.0)."""
-        return equal(self.w, 1.0)
+        """Return True if this tuple represents a point (w = 1.0).
+
+        The factories and point/vector arithmetic only ever produce
+        w values of exactly 0.0 or 1.0, so w is compared exactly."""
+        return self.w == 1.0
     
     @property
     def is_vector(self) -> bool:
-        """Return True if this tuple represents a vector (w ≈ 0.0)."""
-        return equal(self.w, 0.0)
+        """Return True if this tuple represents a vector (w = 0.0)."""
+        return self.w == 0.0
     
     @property
     def is_unit_vector(self) -> bool:
@@ -40,8 +75,8 @@ class Tuple:
     
     @property
     def is_color(self) -> bool:
-        # treat anything created via color() as a color
-        return self.w == 0.0 and hasattr(self, "red")
+        """Return True if this tuple was created as a color (see Color)."""
+        return isinstance(self, PyColor)
     
     # --- color channel aliases ---
 
@@ -60,20 +95,36 @@ class Tuple:
     def point(x: float, y: float, z: float) -> "Tuple":
         """Create a point at (x, y, z) in 3D space.
         A point has w = 1.0, distinguishing it from a vector or color."""
-        return Tuple(x, y, z, 1.0)
+        return PyTuple._raw(x, y, z, 1.0)
 
     @staticmethod
     def vector(x: float, y: float, z: float) -> "Tuple":
         """Create a vector with components (x, y, z).
         A vector has w = 0.0, representing direction and magnitude
         but no fixed position."""
-        return Tuple(x, y, z, 0.0)
+        return PyTuple._raw(x, y, z, 0.0)
 
     @staticmethod
     def color(red: float, green: float, blue: float) -> "Tuple":
         """Create a color using normalized floats (0-1).
         Values may be outside [0,1] during calculations."""
-        return Tuple(red, green, blue, 0.0)
+        return PyColor._raw(red, green, blue, 0.0)
+
+    @staticmethod
+    def from_array(a: np.ndarray) -> "Tuple":
+        """Create a tuple from a length-4 array-like of (x, y, z, w)."""
+        x, y, z, w = np.asarray(a, dtype=np.float64).tolist()
+        return PyTuple._raw(x, y, z, w)
+
+    # --- conversions ---
+
+    def to_array(self, dtype=np.float64) -> np.ndarray:
+        """Return the components as a shape (4,) ndarray of (x, y, z, w).
+
+        Components stay plain floats on the tuple itself; single-vector
+        arithmetic is faster on Python floats than on tiny ndarrays.
+        Use this to hand a tuple to numpy-based code."""
+        return np.array((self.x, self.y, self.z, self.w), dtype=dtype)
 
     # --- arithmetic ---
         
@@ -84,9 +135,9 @@ class Tuple:
         - Vector + Vector -> Vector
         - Point + Point -> invalid (w=2), neither point nor vector
         """
-        if not isinstance(other, Tuple):
-            raise NotImplemented
-        return Tuple(
+        if not isinstance(other, PyTuple):
+            return NotImplemented
+        return self._raw(
             self.x + other.x,
             self.y + other.y,
             self.z + other.z,
@@ -101,9 +152,9 @@ class Tuple:
         - Vector - Vector -> Vector
         - Vector - Point -> invalid (w=-1), neither point nor vector
         """
-        if not isinstance(other, Tuple):
-            raise NotImplemented
-        return Tuple(
+        if not isinstance(other, PyTuple):
+            return NotImplemented
+        return self._raw(
             self.x - other.x,
             self.y - other.y,
             self.z - other.z,
@@ -116,16 +167,16 @@ class Tuple:
         Returns True if all components are equal within a small margin
         of error. This avoids issues with floating-point precision.
         """
-        if not isinstance(other, Tuple):
-            raise NotImplemented
-        return (equal(self.x, other.x)
-                and equal(self.y, other.y)
-                and equal(self.z, other.z)
-                and equal(self.w, other.w))
+        if not isinstance(other, PyTuple):
+            return NotImplemented
+        return (abs(self.x - other.x) < EPSILON
+                and abs(self.y - other.y) < EPSILON
+                and abs(self.z - other.z) < EPSILON
+                and abs(self.w - other.w) < EPSILON)
     
     def __neg__(self) -> Tuple:
         """Return a new Tuple with all components negated."""
-        return Tuple(
+        return self._raw(
             -self.x,
             -self.y,
             -self.z,
@@ -134,21 +185,27 @@ class Tuple:
     
     def __mul__(self, scalar: float) -> Tuple:
         """Multiply all components of the tuple by a scalar."""
-        return Tuple(
-            self.x * scalar,
-            self.y * scalar,
-            self.z * scalar,
-            self.w * scalar
-        )
+        try:
+            return self._raw(
+                self.x * scalar,
+                self.y * scalar,
+                self.z * scalar,
+                self.w * scalar
+            )
+        except TypeError:
+            return NotImplemented
 
     def __truediv__(self, scalar: float) -> Tuple:
         """Divide all components of the tuple by a scalar."""
-        return Tuple(
-            self.x / scalar,
-            self.y / scalar, 
-            self.z / scalar,
-            self.w / scalar
-        )
+        try:
+            return self._raw(
+                self.x / scalar,
+                self.y / scalar,
+                self.z / scalar,
+                self.w / scalar
+            )
+        except TypeError:
+            return NotImplemented
     
     # --- color operations ---
 
@@ -158,9 +215,9 @@ class Tuple:
         Notes:
             - Usually light (self) x surface (other) color.
         """
-        if not isinstance(other, Tuple):
-            raise NotImplemented
-        return Tuple(
+        if not isinstance(other, PyTuple):
+            raise TypeError("Hadamard product requires a Tuple.")
+        return self._raw(
             self.x * other.x,
             self.y * other.y,
             self.z * other.z,
@@ -170,10 +227,13 @@ class Tuple:
     # --- vector operations ---
 
     def magnitude(self) -> float:
-        """Return the magnitude (length) of the vector."""
-        return math.sqrt(
-            self.x**2 + self.y**2 + self.z**2 + self.w**2
-        )
+        """Return the magnitude (length) of the vector.
+        The result is cached, since tuples are never modified."""
+        mag = self._mag
+        if mag is None:
+            mag = math.hypot(self.x, self.y, self.z, self.w)
+            _set_mag(self, mag)
+        return mag
     
     def normalize(self) -> "Tuple":
         """Return a unit vector in the same direction as this vector.
@@ -183,7 +243,9 @@ class Tuple:
         mag = self.magnitude()
         if equal(mag, 0.0):
             raise ValueError("A zero vector cannot be normalized.")
-        return Tuple(self.x/mag, self.y/mag, self.z/mag, 0.0)
+        unit = PyTuple._raw(self.x/mag, self.y/mag, self.z/mag, 0.0)
+        _set_mag(unit, 1.0)
+        return unit
 
     def dot(self, other: Tuple) -> float:
         """Return dot product, AKA scalar product or inner product, of two tuples.
@@ -201,8 +263,8 @@ class Tuple:
             - Dot product of parallel (identical) unit vectors = 1 
             - Dot product of opposite unit vectors = -1
         """
-        if not isinstance(other, Tuple):
-            raise NotImplemented
+        if not isinstance(other, PyTuple):
+            raise TypeError("Dot product requires a Tuple.")
         if not self.is_vector:
             raise ValueError("Dot product cannot be performed on points.")
         return (
@@ -223,17 +285,59 @@ class Tuple:
             - Magnitude of the cross-product = area of the parallelogram 
             spanned by original two vectors.
         """
-        if not isinstance(other, Tuple):
-            raise NotImplemented
-        if not (self.is_vector and other.is_vector):
-            raise ValueError("Cross product is only defined for vectors.")
-        else:
-            return Tuple(
-                self.y * other.z - self.z * other.y,
-                self.z * other.x - self.x * other.z,
-                self.x * other.y - self.y * other.x,
-                0.0
-            )
+        if not isinstance(other, PyTuple):
+            raise TypeError("Cross product requires a Tuple.")
+        if __debug__:  # stripped under python -O
+            if not (self.w == 0.0 and other.w == 0.0):
+                raise ValueError("Cross product is only defined for vectors.")
+        ax, ay, az = self.x, self.y, self.z
+        bx, by, bz = other.x, other.y, other.z
+        return PyTuple._raw(
+            ay * bz - az * by,
+            az * bx - ax * bz,
+            ax * by - ay * bx,
+            0.0
+        )
+
+
+# The pure-Python classes under names the compiled import below cannot
+# shadow; methods above refer to these so they stay self-consistent.
+PyTuple = Tuple
+
+# __setattr__ rejects every write, so tuples are filled in through the
+# slot descriptors directly
+_set_x = Tuple.x.__set__
+_set_y = Tuple.y.__set__
+_set_z = Tuple.z.__set__
+_set_w = Tuple.w.__set__
+_set_mag = Tuple._mag.__set__
+
+
+class Color(Tuple):
+    """A Tuple tagged as a color.
+
+    Behaves exactly like a vector-style Tuple (w=0.0); the subclass only
+    records that it holds red, green and blue channels. Arithmetic on a
+    color returns a color.
+    """
+    __slots__ = ()
+
+PyColor = Color
+
+
+# Prefer the compiled classes from src/ctuple.pyx when they have been
+# built (see setup.py); otherwise the pure-Python classes above are used.
+try:
+    from src.ctuple import Tuple, Color
+except ImportError:
+    pass
+
+
+# factory shortcuts
+
+point = Tuple.point
+vector = Tuple.vector
+color = Tuple.color
 
 
 # helper functions 
@@ -247,4 +351,12 @@ def to_rgb(c: Tuple) -> tuple[int, int, int]:
     )
 
 
+# common constants
 
+ORIGIN = point(0, 0, 0)
+ZERO_VECTOR = vector(0, 0, 0)
+UNIT_X = vector(1, 0, 0)
+UNIT_Y = vector(0, 1, 0)
+UNIT_Z = vector(0, 0, 1)
+BLACK = color(0, 0, 0)
+WHITE = color(1, 1, 1)
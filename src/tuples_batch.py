@@ -0,0 +1,248 @@
+from __future__ import annotations
+from src.tuples import Tuple
+from src.utils import kernels
+from src.utils.math_utils import EPSILON
+from dataclasses import dataclass
+from typing import Iterable, NamedTuple
+import numpy as np
+
+try:
+    from src import _batch  # compiled AVX2/scalar kernels, see setup.py
+except ImportError:
+    _batch = None
+
+# Geometry rarely needs double precision and colors end up as 8-bit
+# channels anyway; narrower storage halves (or quarters) the bytes
+# every batch operation has to stream.
+GEOMETRY_DTYPE = np.float32
+COLOR_DTYPE = np.float16
+
+
+class Tuples(NamedTuple):
+    """A batch of N tuples stored as four contiguous columns (SoA).
+
+    Each field is a 1-D ndarray of length N holding one component for
+    every tuple in the batch, so component-wise operations run as a
+    single vectorized loop per column instead of N Python-level calls.
+    """
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    w: np.ndarray
+
+
+def _native(*columns: np.ndarray) -> bool:
+    """Return True if the compiled float32 kernels can take these columns."""
+    return _batch is not None and all(
+        c.dtype == np.float32 and c.flags.c_contiguous for c in columns
+    )
+
+def _jittable(*columns: np.ndarray) -> bool:
+    """Return True if the numba kernels can take these columns.
+    numba has no float16 arithmetic, so color batches use numpy. The
+    kernels allocate their output like their first input, so mixed
+    dtypes also use numpy, which promotes them."""
+    dtype = columns[0].dtype
+    return (kernels.HAVE_NUMBA and dtype in _JIT_DTYPES
+            and all(c.dtype == dtype for c in columns))
+
+_JIT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+# --- conversions ---
+
+def from_aos(tuples: Iterable[Tuple], dtype=GEOMETRY_DTYPE) -> Tuples:
+    """Pack a sequence of Tuple objects into column storage.
+
+    Columns are float32 by default; pass dtype=np.float64 when full
+    double precision is needed."""
+    a = np.array([(t.x, t.y, t.z, t.w) for t in tuples], dtype=dtype).reshape(-1, 4)
+    return Tuples(*(np.ascontiguousarray(a[:, i]) for i in range(4)))
+
+def colors_from_aos(colors: Iterable[Tuple]) -> Tuples:
+    """Pack a sequence of colors into compact float16 column storage.
+    Use promote() before accumulating many values, as float16 keeps
+    only about 3 significant digits."""
+    return from_aos(colors, dtype=COLOR_DTYPE)
+
+def promote(batch: Tuples, dtype=GEOMETRY_DTYPE) -> Tuples:
+    """Return a copy of the batch with every column widened to dtype."""
+    return Tuples(*(c.astype(dtype) for c in batch))
+
+def to_aos(batch: Tuples) -> list[Tuple]:
+    """Unpack column storage back into a list of Tuple objects."""
+    return [Tuple(x, y, z, w) for x, y, z, w in zip(
+        batch.x.tolist(), batch.y.tolist(), batch.z.tolist(), batch.w.tolist()
+    )]
+
+
+# --- arithmetic ---
+
+def add_batch(a: Tuples, b: Tuples) -> Tuples:
+    """Add two batches component-wise (see Tuple.__add__)."""
+    if _native(*a, *b):
+        return Tuples(*(_batch.add(p, q) for p, q in zip(a, b)))
+    return Tuples(a.x + b.x, a.y + b.y, a.z + b.z, a.w + b.w)
+
+def sub_batch(a: Tuples, b: Tuples) -> Tuples:
+    """Subtract two batches component-wise (see Tuple.__sub__)."""
+    if _native(*a, *b):
+        return Tuples(*(_batch.sub(p, q) for p, q in zip(a, b)))
+    return Tuples(a.x - b.x, a.y - b.y, a.z - b.z, a.w - b.w)
+
+def equal_batch(a: Tuples, b: Tuples) -> np.ndarray:
+    """Compare two batches element by element with EPSILON tolerance.
+
+    Returns an (N,) bool array that is True wherever Tuple.__eq__ would
+    be. Note that float32 columns only resolve differences of 1e-6 for
+    components below roughly 8 in magnitude. Raises ValueError if the
+    batches differ in length, rather than broadcasting one against the
+    other.
+    """
+    if len(a.x) != len(b.x):
+        raise ValueError("All columns must have the same length.")
+    result = np.abs(a.x - b.x) < EPSILON
+    for p, q in zip(a[1:], b[1:]):
+        result &= np.abs(p - q) < EPSILON
+    return result
+
+
+# --- vector operations ---
+
+def dot_batch(a: Tuples, b: Tuples) -> np.ndarray:
+    """Return the dot product of each pair of vectors.
+
+    Notes:
+        - Only x, y and z are read; as with Tuple.dot the inputs are
+        expected to be vectors (w=0.0), so no check is made per element.
+    """
+    if _native(a.x, a.y, a.z, b.x, b.y, b.z):
+        return _batch.dot3(a.x, a.y, a.z, b.x, b.y, b.z)
+    if _jittable(a.x, a.y, a.z, b.x, b.y, b.z):
+        return kernels.dot_columns(a.x, a.y, a.z, b.x, b.y, b.z)
+    return a.x * b.x + a.y * b.y + a.z * b.z
+
+def cross_batch(a: Tuples, b: Tuples) -> Tuples:
+    """Return the cross product of each pair of vectors."""
+    if _native(a.x, a.y, a.z, b.x, b.y, b.z):
+        x, y, z = _batch.cross3(a.x, a.y, a.z, b.x, b.y, b.z)
+        return Tuples(x, y, z, np.zeros_like(a.w))
+    if _jittable(a.x, a.y, a.z, b.x, b.y, b.z):
+        x, y, z = kernels.cross_columns(a.x, a.y, a.z, b.x, b.y, b.z)
+        return Tuples(x, y, z, np.zeros_like(a.w))
+    return Tuples(
+        a.y * b.z - a.z * b.y,
+        a.z * b.x - a.x * b.z,
+        a.x * b.y - a.y * b.x,
+        np.zeros_like(a.w)
+    )
+
+def magnitude_batch(a: Tuples) -> np.ndarray:
+    """Return the magnitude (length) of each vector."""
+    if _native(a.x, a.y, a.z):
+        return _batch.mag3(a.x, a.y, a.z)
+    if _jittable(a.x, a.y, a.z):
+        return kernels.magnitude_columns(a.x, a.y, a.z)
+    return np.sqrt(a.x * a.x + a.y * a.y + a.z * a.z)
+
+def normalize_batch(a: Tuples) -> Tuples:
+    """Normalize every vector in the batch in place and return it.
+
+    The x, y and z columns are overwritten; w is left untouched
+    (it is 0.0 for vectors). Raises ValueError if any vector has
+    zero magnitude, mirroring Tuple.normalize.
+    """
+    if _jittable(a.x, a.y, a.z):
+        if not kernels.normalize_columns(a.x, a.y, a.z, EPSILON):
+            raise ValueError("A zero vector cannot be normalized.")
+        return a
+    mag = magnitude_batch(a)
+    if np.any(mag < EPSILON):
+        raise ValueError("A zero vector cannot be normalized.")
+    np.divide(a.x, mag, out=a.x)
+    np.divide(a.y, mag, out=a.y)
+    np.divide(a.z, mag, out=a.z)
+    return a
+
+
+# --- color operations ---
+
+def to_rgb_batch(colors: Tuples) -> np.ndarray:
+    """Clamp and convert a batch of colors to an (N, 3) uint8 RGB array.
+
+    Only float64 batches match tuples.to_rgb exactly. float32 (the
+    from_aos default) and float16 (colors_from_aos) channels were
+    already rounded when stored, so a channel near a half-level
+    boundary can land one level off: 0.8686274 gives 222 in float32
+    and 0.7 gives 179 in float16, where to_rgb gives 221 and 178.
+    Widening before the multiply would not help, so float16 is only
+    promoted to float32. The result is row-major, so rgb.tobytes()
+    yields packed RGB pixel data.
+    """
+    dtype = np.promote_types(colors.x.dtype, np.float32)
+    rgb = np.stack((colors.x, colors.y, colors.z), axis=-1, dtype=dtype)
+    np.multiply(rgb, 255.0, out=rgb)
+    np.rint(rgb, out=rgb)
+    np.clip(rgb, 0, 255, out=rgb)
+    return rgb.astype(np.uint8)
+
+
+# --- AoSoA blocks ---
+
+LANES = 8  # float32 lanes in one 256-bit AVX2 register
+
+@dataclass
+class TupleBlock8:
+    """A batch of tuples stored as blocks of 8 lanes per component (AoSoA).
+
+    Each field is a (nblocks, 8) float32 array, so one row of a field
+    is exactly one AVX2 register's worth of values and numpy (or a
+    numba kernel looping over blocks) can run every inner loop at full
+    lane width with no remainder. Batches whose length is not a
+    multiple of 8 are zero-padded; n is the real number of tuples.
+    """
+    xs: np.ndarray
+    ys: np.ndarray
+    zs: np.ndarray
+    ws: np.ndarray
+    n: int
+
+    @staticmethod
+    def pack(tuples: Iterable[Tuple]) -> "TupleBlock8":
+        """Pack a sequence of Tuple objects into 8-lane blocks."""
+        cols = from_aos(tuples, dtype=np.float32)
+        n = len(cols.x)
+        padded = -(-n // LANES) * LANES
+        xs, ys, zs, ws = (
+            np.pad(c, (0, padded - n)).reshape(-1, LANES) for c in cols
+        )
+        return TupleBlock8(xs, ys, zs, ws, n)
+
+    def unpack(self) -> list[Tuple]:
+        """Unpack the blocks back into a list of Tuple objects."""
+        return to_aos(Tuples(*(c.reshape(-1)[:self.n] for c in
+                               (self.xs, self.ys, self.zs, self.ws))))
+
+    def add(self, other: "TupleBlock8") -> "TupleBlock8":
+        """Add two blocked batches component-wise."""
+        return TupleBlock8(self.xs + other.xs, self.ys + other.ys,
+                           self.zs + other.zs, self.ws + other.ws, self.n)
+
+    def sub(self, other: "TupleBlock8") -> "TupleBlock8":
+        """Subtract two blocked batches component-wise."""
+        return TupleBlock8(self.xs - other.xs, self.ys - other.ys,
+                           self.zs - other.zs, self.ws - other.ws, self.n)
+
+    def dot(self, other: "TupleBlock8") -> np.ndarray:
+        """Return the (nblocks, 8) dot products of each pair of vectors."""
+        return self.xs * other.xs + self.ys * other.ys + self.zs * other.zs
+
+    def cross(self, other: "TupleBlock8") -> "TupleBlock8":
+        """Return the cross product of each pair of vectors."""
+        return TupleBlock8(
+            self.ys * other.zs - self.zs * other.ys,
+            self.zs * other.xs - self.xs * other.zs,
+            self.xs * other.ys - self.ys * other.xs,
+            np.zeros_like(self.ws),
+            self.n
+        )
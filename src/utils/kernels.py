@@ -0,0 +1,92 @@
+"""Numeric kernels shared by the batch tuple operations.
+
+When numba is installed the kernels are JIT-compiled; otherwise they
+stay plain Python functions with identical results. Installing numba is
+the opt-in: nothing here imports it unless it is available.
+"""
+import math
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is optional
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+
+def _jit(**options):
+    """Compile with numba when available, else return the function unchanged."""
+    if numba is None:
+        return lambda f: f
+    return numba.njit(cache=True, fastmath=True, **options)
+
+prange = numba.prange if HAVE_NUMBA else range
+
+
+# --- scalar kernels (inlined into the column kernels below) ---
+
+@_jit(inline='always')
+def _dot4(ax, ay, az, aw, bx, by, bz, bw):
+    return ax * bx + ay * by + az * bz + aw * bw
+
+@_jit(inline='always')
+def _cross3(ax, ay, az, bx, by, bz):
+    return (ay * bz - az * by,
+            az * bx - ax * bz,
+            ax * by - ay * bx)
+
+@_jit(inline='always')
+def _mag4(x, y, z, w):
+    return math.sqrt(x * x + y * y + z * z + w * w)
+
+@_jit(inline='always')
+def _norm4(x, y, z, w):
+    mag = _mag4(x, y, z, w)
+    return x / mag, y / mag, z / mag, w / mag
+
+
+# --- column kernels ---
+
+@_jit(parallel=True)
+def dot_columns(ax, ay, az, bx, by, bz):
+    """Return the per-element dot product of two sets of xyz columns."""
+    out = np.empty_like(ax)
+    for i in prange(ax.shape[0]):
+        out[i] = _dot4(ax[i], ay[i], az[i], 0.0, bx[i], by[i], bz[i], 0.0)
+    return out
+
+@_jit(parallel=True)
+def cross_columns(ax, ay, az, bx, by, bz):
+    """Return the per-element cross product of two sets of xyz columns."""
+    rx = np.empty_like(ax)
+    ry = np.empty_like(ay)
+    rz = np.empty_like(az)
+    for i in prange(ax.shape[0]):
+        rx[i], ry[i], rz[i] = _cross3(ax[i], ay[i], az[i], bx[i], by[i], bz[i])
+    return rx, ry, rz
+
+@_jit(parallel=True)
+def magnitude_columns(x, y, z):
+    """Return the per-element magnitude of a set of xyz columns."""
+    out = np.empty_like(x)
+    for i in prange(x.shape[0]):
+        out[i] = _mag4(x[i], y[i], z[i], 0.0)
+    return out
+
+@_jit(parallel=True)
+def normalize_columns(x, y, z, eps):
+    """Normalize xyz columns in place.
+
+    Returns False, leaving the columns untouched, if any element has a
+    magnitude below eps.
+    """
+    zeros = 0
+    for i in prange(x.shape[0]):
+        if _mag4(x[i], y[i], z[i], 0.0) < eps:
+            zeros += 1
+    if zeros > 0:
+        return False
+    for i in prange(x.shape[0]):
+        x[i], y[i], z[i], _ = _norm4(x[i], y[i], z[i], 0.0)
+    return True
@@ -0,0 +1,37 @@
+import src.tuples as tuples
+import src.tuples_batch as tuples_batch
+import types
+import pytest
+
+try:
+    from src import ctuple
+except ImportError:  # extension not built
+    ctuple = None
+
+BUILDS = [
+    pytest.param((tuples.PyTuple, tuples.PyColor), id="python"),
+    pytest.param((getattr(ctuple, "Tuple", None), getattr(ctuple, "Color", None)), id="compiled",
+                 marks=pytest.mark.skipif(ctuple is None, reason="src.ctuple extension not built")),
+]
+
+
+@pytest.fixture(params=BUILDS)
+def tuple_build(request, monkeypatch):
+    """Run a test once per Tuple implementation.
+
+    src.ctuple shadows the pure-Python classes as soon as it is built,
+    so the test module's `tuples` is replaced by a copy of src.tuples
+    holding the requested pair, its factory shortcuts and constants.
+    src.tuples itself is left alone, so the pure-Python methods still
+    resolve their own globals. Yields "python" or "compiled".
+    """
+    Tuple, Color = request.param
+    ns = types.SimpleNamespace(**{k: v for k, v in vars(tuples).items() if not k.startswith("__")})
+    ns.Tuple, ns.Color = Tuple, Color
+    ns.point, ns.vector, ns.color = Tuple.point, Tuple.vector, Tuple.color
+    ns.ORIGIN, ns.ZERO_VECTOR = Tuple.point(0, 0, 0), Tuple.vector(0, 0, 0)
+    ns.UNIT_X, ns.UNIT_Y, ns.UNIT_Z = Tuple.vector(1, 0, 0), Tuple.vector(0, 1, 0), Tuple.vector(0, 0, 1)
+    ns.BLACK, ns.WHITE = Tuple.color(0, 0, 0), Tuple.color(1, 1, 1)
+    monkeypatch.setattr(request.module, "tuples", ns)
+    monkeypatch.setattr(tuples_batch, "Tuple", Tuple)
+    yield "python" if Tuple is tuples.PyTuple else "compiled"
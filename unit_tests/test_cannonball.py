@@ -0,0 +1,66 @@
+import src.cannonball as cannonball
+import src.tuples as tuples
+import dataclasses
+import numpy as np
+import pytest
+
+def test_environment_precomputes_acceleration():
+    """Gravity and wind are combined once into a single acceleration vector."""
+    env = cannonball.Environment(gravity=tuples.vector(0, -0.1, 0),
+                                 wind=tuples.vector(-0.01, 0, 0))
+
+    assert env.accel == tuples.vector(-0.01, -0.1, 0)
+
+def test_environment_is_frozen():
+    """Gravity and wind cannot be reassigned, so accel can never go stale."""
+    env = cannonball.Environment(gravity=tuples.vector(0, -0.1, 0),
+                                 wind=tuples.vector(-0.01, 0, 0))
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        env.wind = tuples.vector(0, 0, 0)
+
+def test_step_moves_projectile():
+    """One step moves the position by the velocity and the velocity by the acceleration."""
+    env = cannonball.Environment(gravity=tuples.vector(0, -0.1, 0),
+                                 wind=tuples.vector(-0.01, 0, 0))
+    p = cannonball.Projectile(position=tuples.point(0, 1, 0),
+                              velocity=tuples.vector(1, 1, 0))
+
+    p = cannonball.step(env, p)
+
+    assert p.position == tuples.point(1, 2, 0)
+    assert p.velocity == tuples.vector(0.99, 0.9, 0)
+
+def test_simulate_batch_matches_scalar_steps():
+    """A vectorized swarm lands at the same step and place as the scalar loop."""
+    env = cannonball.Environment(gravity=tuples.vector(0, -0.1, 0),
+                                 wind=tuples.vector(-0.01, 0, 0))
+    starts = [(tuples.point(0, 1, 0), tuples.vector(1, 1, 0)),
+              (tuples.point(0, 2, 0), tuples.vector(0.5, 2, 0))]
+
+    expected_steps, expected_positions = [], []
+    for pos, vel in starts:
+        p = cannonball.Projectile(pos, vel)
+        steps = 0
+        while p.position.y > 0:
+            p = cannonball.step(env, p)
+            steps += 1
+        expected_steps.append(steps)
+        expected_positions.append([p.position.x, p.position.y, p.position.z])
+
+    positions = np.array([[p.x, p.y, p.z] for p, _ in starts], dtype=np.float64)
+    velocities = np.array([[v.x, v.y, v.z] for _, v in starts], dtype=np.float64)
+    accel = np.array([env.accel.x, env.accel.y, env.accel.z], dtype=np.float64)
+
+    steps = cannonball.simulate_batch(positions, velocities, accel, max_steps=1000)
+
+    assert steps.tolist() == expected_steps
+    assert np.allclose(positions, expected_positions)
+
+def test_simulate_batch_reports_airborne_projectiles():
+    """Projectiles still flying after max_steps report -1."""
+    positions = np.array([[0.0, 1.0, 0.0]], dtype=np.float32)
+    velocities = np.array([[0.0, 1.0, 0.0]], dtype=np.float32)
+    accel = np.array([0.0, -0.1, 0.0], dtype=np.float32)
+
+    assert cannonball.simulate_batch(positions, velocities, accel, max_steps=3).tolist() == [-1]
@@ -1,5 +1,9 @@
 from src.utils.math_utils import equal
 import src.tuples as tuples
+import math
+import pytest
+
+pytestmark = pytest.mark.usefixtures("tuple_build")
 
 def test_point():
     """A tuple with w=1.0 is a point."""
@@ -146,6 +150,14 @@ def test_magnitude_of_negative_vector():
     expected = 14 ** 0.5
     assert equal(v.magnitude(), expected)
 
+def test_magnitude_does_not_overflow():
+    """Magnitude goes through math.hypot, so huge components stay finite and normalize."""
+    v = tuples.Tuple.vector(1e200, 1e200, 0)
+
+    assert v.magnitude() == math.hypot(1e200, 1e200)
+    assert v.normalize().is_unit_vector
+    assert tuples.Tuple(0.1, 0.2, 0.3, 0.4).magnitude() == math.hypot(0.1, 0.2, 0.3, 0.4)
+
 def test_normalize_to_unit_vector():
     """Normalized vectors have magnitudes of 1."""
     v = tuples.Tuple.vector(3, 6, 9)
@@ -184,6 +196,18 @@ def test_cross_product():
 
     assert v1.cross(v2) == expectation
 
+@pytest.mark.skipif(not __debug__, reason="the vector check is stripped under python -O")
+def test_cross_product_rejects_points():
+    """Cross product is only defined for vectors (checked unless run with python -O)."""
+    with pytest.raises(ValueError):
+        tuples.Tuple.point(1, 2, 3).cross(tuples.Tuple.vector(1, 0, 0))
+
+@pytest.mark.skipif(__debug__, reason="only python -O strips the vector check")
+def test_cross_product_skips_vector_check_under_optimize():
+    """Under python -O both builds skip the check and return the xyz cross product."""
+    result = tuples.Tuple.point(1, 2, 3).cross(tuples.Tuple.vector(1, 0, 0))
+    assert result == tuples.Tuple.vector(0, 3, -2)
+
 def test_create_color():
     """Create a color from a (r, g, b) tuple."""
     c = tuples.Tuple.color(0.7, 1.8, 0.3)
@@ -244,3 +268,101 @@ def test_hadamard_product_colors():
     expected = tuples.Tuple(0.9, 0.2, 0.04, 0.0)
 
     assert result == expected
+
+def test_tuple_array_round_trip():
+    """A tuple converts to a (4,) ndarray and back without losing components."""
+    p = tuples.Tuple.point(1, -2, 3.5)
+    a = p.to_array()
+
+    assert a.shape == (4,)
+    assert a.tolist() == [1.0, -2.0, 3.5, 1.0]
+    assert tuples.Tuple.from_array(a) == p
+
+def test_tuple_hash_and_repr(tuple_build):
+    """Tuples with identical components hash alike and can key a dict."""
+    if tuple_build != "python":
+        pytest.skip("pure-Python Tuple keeps the component types it is given")
+    p1 = tuples.Tuple.point(1, 2, 3)
+    p2 = tuples.Tuple.point(1, 2, 3)
+
+    assert hash(p1) == hash(p2)
+    assert {p1: "a"}[p2] == "a"
+    assert repr(p1) == "Tuple(x=1, y=2, z=3, w=1.0)"
+
+def test_compiled_tuple_hash_and_repr(tuple_build):
+    """The compiled Tuple stores C doubles, so int components come back as floats."""
+    if tuple_build != "compiled":
+        pytest.skip("only the compiled Tuple converts components to C doubles")
+    p1 = tuples.Tuple.point(1, 2, 3)
+    p2 = tuples.Tuple.point(1.0, 2.0, 3.0)
+
+    assert hash(p1) == hash(p2)
+    assert {p1: "a"}[p2] == "a"
+    assert repr(p1) == "Tuple(x=1.0, y=2.0, z=3.0, w=1.0)"
+
+def test_tuples_as_set_members():
+    """Distinct tuples stay distinct in a set; 0.0 and -0.0 hash alike."""
+    grid = {tuples.Tuple.point(i, j, k) for i in range(5) for j in range(5) for k in range(5)}
+
+    assert len(grid) == 125
+    assert hash(tuples.Tuple(0.0, 0.0, 0.0, 0.0)) == hash(tuples.Tuple(-0.0, 0.0, -0.0, 0.0))
+
+def test_magnitude_is_cached():
+    """Magnitude is computed once per tuple; normalized vectors start at 1."""
+    v = tuples.Tuple.vector(1, 2, 2)
+
+    assert v.magnitude() == 3.0
+    assert v._mag == 3.0
+    assert v.normalize()._mag == 1.0
+
+def test_tuples_are_immutable():
+    """Assigning to a component raises, so cached magnitudes and shared constants stay valid."""
+    v = tuples.Tuple.vector(3, 4, 0)
+    assert v.magnitude() == 5.0
+
+    for name in ("x", "y", "z", "w"):
+        with pytest.raises(AttributeError):
+            setattr(v, name, 0.0)
+    with pytest.raises(AttributeError):
+        tuples.ORIGIN.x = 9
+    assert v.magnitude() == 5.0 and tuples.ORIGIN.x == 0.0
+
+def test_colors_are_tagged_explicitly():
+    """Only tuples created as colors report is_color, and color arithmetic keeps the tag."""
+    c = tuples.Tuple.color(0.2, 0.3, 0.4)
+    v = tuples.Tuple.vector(0.2, 0.3, 0.4)
+
+    assert c.is_color
+    assert not v.is_color
+    assert (c + c).is_color
+    assert (c * 2).is_color
+    assert c.hadamard(c).is_color
+    assert c == v
+
+def test_common_constants():
+    """Frequently used tuples are shared module-level constants."""
+    assert tuples.ORIGIN == tuples.Tuple.point(0, 0, 0)
+    assert tuples.ZERO_VECTOR == tuples.Tuple.vector(0, 0, 0)
+    assert tuples.UNIT_X.cross(tuples.UNIT_Y) == tuples.UNIT_Z
+    assert tuples.BLACK.is_color and tuples.WHITE == tuples.Tuple.color(1, 1, 1)
+
+def test_factories_return_fresh_tuples():
+    """Factories never hand back another call's instance, so the sign of zero survives."""
+    assert tuples.Tuple.point(0, 0, 0) is not tuples.ORIGIN
+    assert math.copysign(1.0, tuples.Tuple.vector(-0.0, 1, 0).x) == -1.0
+    assert math.copysign(1.0, tuples.Tuple.vector(0.0, 1, 0).x) == 1.0
+
+def test_arithmetic_with_non_tuples():
+    """Unsupported operands raise TypeError; comparing to a non-tuple is just unequal."""
+    v = tuples.Tuple.vector(1, 2, 3)
+
+    with pytest.raises(TypeError):
+        v + 5
+    with pytest.raises(TypeError):
+        v - "a"
+    with pytest.raises(TypeError):
+        v * v
+    with pytest.raises(TypeError):
+        v.dot(5)
+    assert not v == 5
+    assert v != (1, 2, 3)
@@ -0,0 +1,194 @@
+from src.utils.math_utils import equal
+import src.tuples as tuples
+import src.tuples_batch as batch
+import numpy as np
+import pytest
+
+pytestmark = pytest.mark.usefixtures("tuple_build")
+
+def test_aos_round_trip():
+    """Packing tuples into columns and unpacking them preserves every tuple."""
+    ts = [tuples.Tuple.point(1, 2, 3), tuples.Tuple.vector(-4, 5, 0.5)]
+    b = batch.from_aos(ts)
+
+    assert b.x.tolist() == [1.0, -4.0]
+    assert b.w.tolist() == [1.0, 0.0]
+    assert batch.to_aos(b) == ts
+
+def test_add_and_subtract_batches():
+    """Batch addition and subtraction match the scalar Tuple operators."""
+    ps = [tuples.Tuple.point(-7, 8, 9), tuples.Tuple.point(4, 5, 6)]
+    vs = [tuples.Tuple.vector(4, -5, -6), tuples.Tuple.vector(1, 2, 3)]
+    a, b = batch.from_aos(ps), batch.from_aos(vs)
+
+    assert batch.to_aos(batch.add_batch(a, b)) == [p + v for p, v in zip(ps, vs)]
+    assert batch.to_aos(batch.sub_batch(a, b)) == [p - v for p, v in zip(ps, vs)]
+
+def test_dot_and_cross_batches():
+    """Batch dot and cross products match the scalar Tuple methods."""
+    v1 = [tuples.Tuple.vector(1, 2, 3), tuples.Tuple.vector(1, 0, 0)]
+    v2 = [tuples.Tuple.vector(-5, 5, -5), tuples.Tuple.vector(0, 1, 0)]
+    a, b = batch.from_aos(v1), batch.from_aos(v2)
+
+    dots = batch.dot_batch(a, b)
+    for d, p, q in zip(dots, v1, v2):
+        assert equal(d, p.dot(q))
+    assert batch.to_aos(batch.cross_batch(a, b)) == [p.cross(q) for p, q in zip(v1, v2)]
+
+def test_normalize_batch_in_place():
+    """Normalizing a batch overwrites its columns with unit vectors."""
+    vs = [tuples.Tuple.vector(3, 6, 9), tuples.Tuple.vector(0, 0, 2)]
+    b = batch.from_aos(vs)
+    x = b.x
+
+    result = batch.normalize_batch(b)
+
+    assert result.x is x
+    assert np.allclose(batch.magnitude_batch(result), 1.0)
+    assert batch.to_aos(result) == [v.normalize() for v in vs]
+
+def test_normalize_batch_rejects_zero_vector():
+    """Normalizing a batch that contains a zero vector raises ValueError."""
+    b = batch.from_aos([tuples.Tuple.vector(1, 0, 0), tuples.Tuple.vector(0, 0, 0)])
+    with pytest.raises(ValueError):
+        batch.normalize_batch(b)
+
+def test_numpy_fallback_matches_kernels(monkeypatch):
+    """Without numba or the compiled kernels the batch functions fall back to plain numpy."""
+    v1 = [tuples.Tuple.vector(1, 2, 3), tuples.Tuple.vector(3, 6, 9)]
+    v2 = [tuples.Tuple.vector(-5, 5, -5), tuples.Tuple.vector(0, 1, 0)]
+    a, b = batch.from_aos(v1), batch.from_aos(v2)
+    expected = (batch.dot_batch(a, b), batch.cross_batch(a, b), batch.magnitude_batch(a))
+
+    monkeypatch.setattr(batch.kernels, "HAVE_NUMBA", False)
+    monkeypatch.setattr(batch, "_batch", None)
+
+    assert np.allclose(batch.dot_batch(a, b), expected[0])
+    assert batch.to_aos(batch.cross_batch(a, b)) == batch.to_aos(expected[1])
+    assert np.allclose(batch.magnitude_batch(a), expected[2])
+    assert batch.to_aos(batch.normalize_batch(a)) == [v.normalize() for v in v1]
+
+def test_batch_storage_dtypes():
+    """Geometry packs as float32 and colors as float16, promotable on demand."""
+    geometry = batch.from_aos([tuples.Tuple.point(1, 2, 3)])
+    colors = batch.colors_from_aos([tuples.Tuple.color(1.0, 0.5, 0.25)])
+
+    assert geometry.x.dtype == np.float32
+    assert colors.x.dtype == np.float16
+    assert batch.promote(colors).x.dtype == np.float32
+    assert batch.to_aos(batch.promote(colors)) == [tuples.Tuple.color(1.0, 0.5, 0.25)]
+
+def test_mixed_dtype_batches_promote():
+    """Mixing float32 and float64 batches gives float64 results, with or without numba."""
+    vs = [tuples.Tuple.vector(1, 2, 3), tuples.Tuple.vector(0.1, 0.2, 0.3)]
+    a, b = batch.from_aos(vs, dtype=np.float32), batch.from_aos(vs, dtype=np.float64)
+
+    assert batch.dot_batch(a, b).dtype == np.float64
+    assert all(c.dtype == np.float64 for c in batch.cross_batch(a, b)[:3])
+    assert batch.dot_batch(b, a).dtype == np.float64
+
+def test_vector_ops_on_float16_color_batches():
+    """float16 color batches work with every vector op, falling back to numpy."""
+    cs = [tuples.Tuple.color(0.7, 0.2, 0.4), tuples.Tuple.color(1.0, 0.5, 0.25)]
+    a, b = batch.colors_from_aos(cs), batch.colors_from_aos(cs[::-1])
+    wide = batch.promote(a, np.float64), batch.promote(b, np.float64)
+
+    assert np.allclose(batch.dot_batch(a, b), batch.dot_batch(*wide), atol=1e-3)
+    assert np.allclose(batch.magnitude_batch(a), batch.magnitude_batch(wide[0]), atol=1e-3)
+    crossed = batch.cross_batch(a, b)
+    for got, expected in zip(crossed, batch.cross_batch(*wide)):
+        assert np.allclose(got, expected, atol=1e-3)
+    normalized = batch.normalize_batch(a)
+    assert normalized.x.dtype == np.float16
+    assert np.allclose(batch.magnitude_batch(normalized), 1.0, atol=1e-3)
+
+def test_block8_pack_pads_to_full_lanes():
+    """Packing 10 tuples fills two 8-lane blocks and unpacks to the same 10."""
+    ts = [tuples.Tuple.vector(i, 2 * i, -i) for i in range(10)]
+    blocks = batch.TupleBlock8.pack(ts)
+
+    assert blocks.xs.shape == (2, 8)
+    assert blocks.xs.dtype == np.float32
+    assert blocks.unpack() == ts
+
+def test_block8_operations_match_scalar():
+    """Blocked add, sub, dot and cross match the scalar Tuple operations."""
+    v1 = [tuples.Tuple.vector(1, 2, 3), tuples.Tuple.vector(1, 0, 0)]
+    v2 = [tuples.Tuple.vector(-5, 5, -5), tuples.Tuple.vector(0, 1, 0)]
+    a, b = batch.TupleBlock8.pack(v1), batch.TupleBlock8.pack(v2)
+
+    assert a.add(b).unpack() == [p + q for p, q in zip(v1, v2)]
+    assert a.sub(b).unpack() == [p - q for p, q in zip(v1, v2)]
+    assert a.cross(b).unpack() == [p.cross(q) for p, q in zip(v1, v2)]
+    assert a.dot(b).reshape(-1)[:2].tolist() == [p.dot(q) for p, q in zip(v1, v2)]
+
+def test_to_rgb_batch_matches_scalar():
+    """Batched color conversion clamps and rounds like to_rgb; these channels are dyadic, so every dtype stores them exactly."""
+    cs = [tuples.Tuple.color(1.0, 0.5, 0.0), tuples.Tuple.color(-0.5, 1.5, 0.25)]
+
+    for b in (batch.from_aos(cs, dtype=np.float64), batch.colors_from_aos(cs)):
+        rgb = batch.to_rgb_batch(b)
+        assert rgb.dtype == np.uint8
+        assert [tuple(row) for row in rgb.tolist()] == [tuples.to_rgb(c) for c in cs]
+
+def test_to_rgb_batch_narrow_rounding():
+    """Non-dyadic channels match to_rgb in float64 and are at most one level off in float32/float16."""
+    cs = [tuples.Tuple.color(0.7, 0.7, 0.7), tuples.Tuple.color(0.8686274, 0.76666666, 0.1)]
+    expected = np.array([tuples.to_rgb(c) for c in cs])
+
+    assert np.array_equal(batch.to_rgb_batch(batch.from_aos(cs, dtype=np.float64)), expected)
+
+    rgb32 = batch.to_rgb_batch(batch.from_aos(cs)).astype(int)
+    rgb16 = batch.to_rgb_batch(batch.colors_from_aos(cs)).astype(int)
+    assert expected[1, 0] == 221 and rgb32[1, 0] == 222
+    assert expected[0, 0] == 178 and rgb16[0, 0] == 179
+    assert np.abs(rgb32 - expected).max() <= 1
+    assert np.abs(rgb16 - expected).max() <= 1
+
+def test_tuple_is_never_equal_to_a_batch():
+    """Comparing a Tuple with a Tuples batch is plain False, whatever the batch length."""
+    v = tuples.Tuple.vector(1, 2, 3)
+    for n in (1, 2):
+        b = batch.from_aos([v] * n)
+        assert (v == b) is False
+        assert (v != b) is True
+
+def test_tuple_arithmetic_rejects_batches():
+    """Adding or subtracting a Tuples batch to a Tuple raises instead of building ndarray components."""
+    v = tuples.Tuple.vector(1, 2, 3)
+    b = batch.from_aos([v])
+    with pytest.raises(TypeError):
+        v + b
+    with pytest.raises(TypeError):
+        v - b
+
+def test_compiled_kernels_match_numpy():
+    """The compiled float32 kernels agree with numpy, including the non-multiple-of-8 tail."""
+    _batch = pytest.importorskip("src._batch")
+    rng = np.random.default_rng(7)
+    ax, ay, az, bx, by, bz = rng.standard_normal((6, 19)).astype(np.float32)
+
+    assert np.allclose(_batch.add(ax, bx), ax + bx)
+    assert np.allclose(_batch.sub(ax, bx), ax - bx)
+    assert np.allclose(_batch.dot3(ax, ay, az, bx, by, bz), ax * bx + ay * by + az * bz)
+    assert np.allclose(_batch.mag3(ax, ay, az), np.sqrt(ax * ax + ay * ay + az * az))
+    rx, ry, rz = _batch.cross3(ax, ay, az, bx, by, bz)
+    assert np.allclose(rx, ay * bz - az * by)
+    assert np.allclose(ry, az * bx - ax * bz)
+    assert np.allclose(rz, ax * by - ay * bx)
+    with pytest.raises(ValueError):
+        _batch.add(ax, bx[:5])
+
+def test_equal_batch_matches_tuple_equality():
+    """Batch comparison applies the same tolerance as Tuple.__eq__."""
+    ps = [tuples.Tuple.point(1, 2, 3), tuples.Tuple.point(1, 2, 3), tuples.Tuple.vector(1, 2, 3)]
+    qs = [tuples.Tuple.point(1, 2, 3.0000001), tuples.Tuple.point(1, 2.1, 3), tuples.Tuple.point(1, 2, 3)]
+    a, b = batch.from_aos(ps, dtype=np.float64), batch.from_aos(qs, dtype=np.float64)
+
+    assert batch.equal_batch(a, b).tolist() == [p == q for p, q in zip(ps, qs)] == [True, False, False]
+
+def test_equal_batch_rejects_length_mismatch():
+    """A 1-tuple batch is not broadcast against a longer one."""
+    p = tuples.Tuple.point(1, 2, 3)
+    with pytest.raises(ValueError):
+        batch.equal_batch(batch.from_aos([p]), batch.from_aos([p, p, p]))